@@ -2,15 +2,54 @@
 Fallback name generation when API fails.
 """
 
-import orjson
+from functools import lru_cache
+import itertools
 
-def generate_fallback_names(description, variants):
-    """Generate fallback names when API fails"""
+from core.name_parser import name_key, names_to_response
+
+STOP_WORDS = frozenset(['the', 'and', 'for', 'with', 'from', 'this', 'that', 'about', 'your', 'channel', 'videos', 'content'])
+
+# Niche-specific suggestions
+NICHE_SUGGESTIONS = {
+    'cook': ['Kitchen', 'Chef', 'Taste', 'Food', 'Recipe'],
+    'tech': ['Tech', 'Code', 'Dev', 'Digital', 'Cyber'],
+    'fitness': ['Fit', 'Strong', 'Health', 'Gym', 'Workout'],
+    'education': ['Learn', 'Study', 'Academy', 'School', 'Edu'],
+    'gaming': ['Game', 'Play', 'Gamer', 'Arcade', 'Quest'],
+    'music': ['Music', 'Sound', 'Audio', 'Beat', 'Rhythm'],
+    'art': ['Art', 'Creative', 'Design', 'Studio', 'Canvas'],
+    'travel': ['Travel', 'Journey', 'Adventure', 'Explore', 'Wander']
+}
+
+
+@lru_cache(maxsize=256)
+def extract_keywords(description):
+    """Extract keywords from a description, cached so later pages reuse them"""
+    words = description.lower().split()
+    keywords = [w for w in words if len(w) > 3 and w not in STOP_WORDS]
+
+    # Add niche-specific keywords (only for words from the description itself)
+    extra = []
+    for word in keywords:
+        for niche, suggestions in NICHE_SUGGESTIONS.items():
+            if niche in word:
+                extra.extend(suggestions)
+                break
+    return tuple(keywords + extra)
+
+
+def generate_fallback_names(description, variants, used_names=None, near_duplicates=None):
+    """Generate fallback names when API fails
+
+    ``used_names`` is an optional collection of names that were already shown;
+    they are never returned again. Template names that are near duplicates of
+    earlier ones are skipped; pass a shared ``near_duplicates`` index to check
+    against a running corpus across calls.
+    """
     import random
+    from core.near_duplicates import NearDuplicateIndex
     
-    # Extract keywords from description
-    words = description.lower().split()
-    keywords = [w for w in words if len(w) > 3 and w not in ['the', 'and', 'for', 'with', 'from', 'this', 'that', 'about', 'your', 'channel', 'videos', 'content']]
+    keywords = list(extract_keywords(description))
     
     # Enhanced name templates based on common YouTube niches
     templates = [
@@ -28,27 +67,10 @@ def generate_fallback_names(description, variants):
     prefixes = ["Pro", "Elite", "Master", "Prime", "Ultra", "Super", "Max", "Top", "Best", "Great"]
     suffixes = ["Hub", "Zone", "Lab", "Studio", "Academy", "Works", "Pro", "Elite", "TV", "Tube", "Channel", "Media", "Content"]
     
-    # Niche-specific suggestions
-    niche_suggestions = {
-        'cook': ['Kitchen', 'Chef', 'Taste', 'Food', 'Recipe'],
-        'tech': ['Tech', 'Code', 'Dev', 'Digital', 'Cyber'],
-        'fitness': ['Fit', 'Strong', 'Health', 'Gym', 'Workout'],
-        'education': ['Learn', 'Study', 'Academy', 'School', 'Edu'],
-        'gaming': ['Game', 'Play', 'Gamer', 'Arcade', 'Quest'],
-        'music': ['Music', 'Sound', 'Audio', 'Beat', 'Rhythm'],
-        'art': ['Art', 'Creative', 'Design', 'Studio', 'Canvas'],
-        'travel': ['Travel', 'Journey', 'Adventure', 'Explore', 'Wander']
-    }
-    
-    # Add niche-specific keywords
-    for word in keywords:
-        for niche, suggestions in niche_suggestions.items():
-            if niche in word.lower():
-                keywords.extend(suggestions)
-                break
-    
     names = []
-    used_names = set()
+    seen = {name_key(n) for n in used_names} if used_names else set()
+    if near_duplicates is None:
+        near_duplicates = NearDuplicateIndex(used_names)
     
     for i in range(variants):
         attempts = 0
@@ -90,22 +112,28 @@ def generate_fallback_names(description, variants):
             
             # Clean up the name
             name = name.replace("  ", " ").strip()
-            if 8 <= len(name) <= 25 and name not in used_names:
+            key = name_key(name)
+            if 8 <= len(name) <= 25 and key not in seen and near_duplicates.add_if_new(name):
                 names.append(name)
-                used_names.add(name)
+                seen.add(key)
                 break
             attempts += 1
     
     # If we don't have enough names, add some generic but relevant ones
-    while len(names) < variants:
-        generic_names = [
-            "Channel Pro", "Content Hub", "Video Zone", "Media Lab", "Creative Studio",
-            "Digital Academy", "Video Works", "Content Pro", "Media Hub", "Video Lab",
-            "Channel Elite", "Content Zone", "Video Hub", "Media Pro", "Creative Lab"
-        ]
-        for gen_name in generic_names:
-            if gen_name not in used_names and len(names) < variants:
-                names.append(gen_name)
-                used_names.add(gen_name)
+    generic_names = [
+        "Channel Pro", "Content Hub", "Video Zone", "Media Lab", "Creative Studio",
+        "Digital Academy", "Video Works", "Content Pro", "Media Hub", "Video Lab",
+        "Channel Elite", "Content Zone", "Video Hub", "Media Pro", "Creative Lab"
+    ]
+    # Deterministic keyword combinations once the generic list is used up
+    combos = (f"{part} {suffix}" for part in [k.title() for k in keywords] + prefixes for suffix in suffixes)
+    for gen_name in itertools.chain(generic_names, combos):
+        if len(names) >= variants:
+            break
+        key = name_key(gen_name)
+        if key not in seen and 8 <= len(gen_name) <= 25:
+            names.append(gen_name)
+            seen.add(key)
+            near_duplicates.add(gen_name)
     
-    return f'{{"names": {orjson.dumps(names).decode()}}}'
+    return names_to_response(names)
@@ -0,0 +1,172 @@
+"""
+Persistent generation history backed by SQLite.
+
+Every generation (inputs, names, source and latency) is stored in a WAL-mode
+database with a full-text index over names and descriptions. Searches use
+keyset pagination (row id, or name key and row id for prefix searches) so every
+page is an index seek and deep pages stay fast with millions of names.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from core.name_parser import name_key
+
+# Environment variable overriding where the history database lives
+HISTORY_PATH_ENV = "HISTORY_DB_PATH"
+DEFAULT_HISTORY_PATH = "generation_history.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    description TEXT NOT NULL,
+    language TEXT,
+    tone TEXT,
+    variants INTEGER,
+    source TEXT NOT NULL,
+    latency_ms REAL
+);
+CREATE TABLE IF NOT EXISTS names (
+    id INTEGER PRIMARY KEY,
+    generation_id INTEGER NOT NULL REFERENCES generations(id),
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_names_key ON names(name_key);
+CREATE INDEX IF NOT EXISTS idx_names_generation ON names(generation_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS names_fts USING fts5(
+    name, description, content='', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+"""
+
+_SELECT_NAMES = """
+SELECT n.id, n.name_key, n.name, COALESCE(n.source, g.source), g.description, g.language, g.tone, g.created_at, g.latency_ms
+FROM names n JOIN generations g ON g.id = n.generation_id
+"""
+
+
+def _fts_query(text):
+    """Quote each word for FTS5 and let the last one match as a prefix"""
+    terms = ['"' + word.replace('"', '""') + '"' for word in text.split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+class HistoryStore:
+    """Thread-safe handle on the generation history database"""
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv(HISTORY_PATH_ENV) or DEFAULT_HISTORY_PATH
+        # One shared connection guarded by a lock: Streamlit runs every rerun on a
+        # fresh script thread, so per-thread connections would reopen constantly
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            # Databases created before names had a per-name source
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(names)")}
+            if "source" not in columns:
+                self._conn.execute("ALTER TABLE names ADD COLUMN source TEXT")
+
+    def record_generation(self, description, language, tone, variants, names, sources, latency_ms):
+        """Store one generation and its names; returns the generation id
+
+        ``sources`` is either one source ('ai' or 'fallback') for every name or a
+        list with one source per name; a generation mixing both is stored as 'mixed'.
+        """
+        if isinstance(sources, str):
+            sources = [sources] * len(names)
+        distinct = set(sources)
+        source = distinct.pop() if len(distinct) == 1 else "mixed"
+        with self._lock, self._conn as conn:
+            cur = conn.execute(
+                "INSERT INTO generations (created_at, description, language, tone, variants, source, latency_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), description, language, tone, variants, source, latency_ms),
+            )
+            generation_id = cur.lastrowid
+            for name, name_source in zip(names, sources):
+                cur = conn.execute(
+                    "INSERT INTO names (generation_id, name, name_key, source) VALUES (?, ?, ?, ?)",
+                    (generation_id, name, name_key(name), name_source),
+                )
+                conn.execute(
+                    "INSERT INTO names_fts (rowid, name, description) VALUES (?, ?, ?)",
+                    (cur.lastrowid, name, description),
+                )
+        return generation_id
+
+    def search_names(self, query="", prefix=False, limit=20, cursor=None):
+        """One page of stored names
+
+        With ``prefix`` the query matches the start of the name and results are in
+        name order; otherwise it is a keyword search over names and descriptions,
+        newest first (an empty query lists everything newest first). Pass the
+        ``cursor`` of the last row of the previous page to fetch the next page.
+        """
+        query = query.strip()
+        where, params = [], []
+        if query and prefix:
+            # Range scan on the name_key index; U+10FFFF sorts after any real suffix
+            key = name_key(query)
+            if cursor is None:
+                where.append("n.name_key >= ? AND n.name_key < ?")
+                params += [key, key + "\U0010ffff"]
+            else:
+                # Start the range seek at the cursor key so deep pages skip nothing
+                cursor_key, cursor_id = cursor
+                where.append("n.name_key >= ? AND n.name_key < ? AND (n.name_key > ? OR n.id > ?)")
+                params += [cursor_key, key + "\U0010ffff", cursor_key, cursor_id]
+            order = "n.name_key, n.id"
+        elif query:
+            fts_where = "names_fts MATCH ?"
+            fts_params = [_fts_query(query)]
+            if cursor is not None:
+                fts_where += " AND rowid < ?"
+                fts_params.append(cursor)
+            where.append(f"n.id IN (SELECT rowid FROM names_fts WHERE {fts_where} ORDER BY rowid DESC LIMIT ?)")
+            params += fts_params + [limit]
+            order = "n.id DESC"
+        else:
+            if cursor is not None:
+                where.append("n.id < ?")
+                params.append(cursor)
+            order = "n.id DESC"
+
+        sql = _SELECT_NAMES
+        if where:
+            sql += "WHERE " + " AND ".join(where) + " "
+        sql += f"ORDER BY {order} LIMIT ?"
+        params.append(limit)
+
+        columns = ("id", "name_key", "name", "source", "description", "language", "tone", "created_at", "latency_ms")
+        with self._lock:
+            rows = [dict(zip(columns, row)) for row in self._conn.execute(sql, params)]
+        for row in rows:
+            row["cursor"] = (row["name_key"], row["id"]) if query and prefix else row["id"]
+        return rows
+
+    def count_names(self):
+        """Total number of stored names (rows are never deleted)"""
+        with self._lock:
+            return self._conn.execute("SELECT MAX(id) FROM names").fetchone()[0] or 0
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_history_store():
+    """Process-wide HistoryStore, created on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = HistoryStore()
+        return _store
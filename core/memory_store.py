@@ -0,0 +1,219 @@
+"""
+Process-wide, memory-accounted store for per-session results and logos.
+
+Entries are keyed by (session id, key) and share one global byte budget.
+Rebuildable entries are evicted least recently used first, whichever session
+they belong to, and rebuilt lazily from the factory passed to get(). Entries
+that cannot be rebuilt (generation results, AI logos) are pinned: they count
+toward the budget and a per-session cap but are only released once their
+session has ended.
+"""
+
+from collections import OrderedDict, defaultdict
+import logging
+import os
+import sys
+import threading
+
+# Environment variables overriding the global and per-session budgets, in megabytes
+BUDGET_ENV = "SESSION_MEMORY_BUDGET_MB"
+SESSION_BUDGET_ENV = "SESSION_PINNED_LIMIT_MB"
+DEFAULT_BUDGET_MB = 256
+DEFAULT_SESSION_BUDGET_MB = 8
+
+logger = logging.getLogger(__name__)
+
+
+def _sizeof(value):
+    """Approximate memory held by a cached value"""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(k) + _sizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class MemoryStore:
+    """Per-session store bounded by total bytes across all sessions
+
+    ``is_active_session`` is an optional callable used to release pinned entries
+    of sessions that have ended when the budget runs out.
+    """
+
+    def __init__(self, budget_bytes, session_pinned_bytes, is_active_session=None):
+        self.budget_bytes = budget_bytes
+        self.session_pinned_bytes = session_pinned_bytes
+        self._is_active_session = is_active_session
+        self._entries = OrderedDict()
+        self._pinned = {}
+        self._session_pinned = defaultdict(int)
+        self._bytes = 0
+        self._pinned_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._released = 0
+
+    def get(self, session_id, key, factory=None):
+        """Stored value, or factory() stored and returned on a miss (None without one)"""
+        entry_key = (session_id, key)
+        with self._lock:
+            entry = self._pinned.get(entry_key)
+            if entry is None:
+                entry = self._entries.get(entry_key)
+                if entry is not None:
+                    self._entries.move_to_end(entry_key)
+            if entry is not None:
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        if factory is None:
+            return None
+        # Build outside the lock so slow factories do not block other sessions
+        value = factory()
+        self.put(session_id, key, value)
+        return value
+
+    def put(self, session_id, key, value, pinned=False):
+        """Store a value; returns False if it does not fit the budget
+
+        Unpinned values may be evicted later; pinned values stay until their
+        session ends or they are removed.
+        """
+        entry_key = (session_id, key)
+        size = _sizeof(value)
+        with self._lock:
+            was_pinned = entry_key in self._pinned
+            previous = self._pinned.get(entry_key) or self._entries.get(entry_key)
+            self._remove(entry_key)
+            evicted = 0
+            if pinned and self._session_pinned.get(session_id, 0) + size > self.session_pinned_bytes:
+                stored = False
+            else:
+                evicted = self._make_room(size)
+                stored = self._bytes + size <= self.budget_bytes
+            if not stored:
+                # Keep the previous value rather than losing it to a failed update
+                if previous is not None:
+                    self._insert(entry_key, previous, was_pinned)
+            else:
+                self._insert(entry_key, (value, size), pinned)
+            used_bytes, pinned_bytes, total_evictions = self._bytes, self._pinned_bytes, self._evictions
+        if evicted:
+            logger.info(
+                "Evicted %d entries; %d of %d bytes used (%d pinned), %d evictions total",
+                evicted, used_bytes, self.budget_bytes, pinned_bytes, total_evictions,
+            )
+        if not stored:
+            logger.warning("Memory budget exhausted; %d bytes for session %s not stored", size, session_id)
+        return stored
+
+    def remove(self, session_id, key):
+        """Drop a stored value"""
+        with self._lock:
+            self._remove((session_id, key))
+
+    def _insert(self, entry_key, entry, pinned):
+        if pinned:
+            self._pinned[entry_key] = entry
+            self._session_pinned[entry_key[0]] += entry[1]
+            self._pinned_bytes += entry[1]
+        else:
+            self._entries[entry_key] = entry
+        self._bytes += entry[1]
+
+    def _remove(self, entry_key):
+        entry = self._pinned.pop(entry_key, None)
+        if entry is not None:
+            self._pinned_bytes -= entry[1]
+            self._session_pinned[entry_key[0]] -= entry[1]
+            if not self._session_pinned[entry_key[0]]:
+                del self._session_pinned[entry_key[0]]
+        else:
+            entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def _make_room(self, size):
+        """Evict rebuildable entries, then ended sessions' pinned entries, until size fits"""
+        evicted = 0
+        while self._entries and self._bytes + size > self.budget_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            evicted += 1
+        if self._bytes + size > self.budget_bytes and self._is_active_session is not None:
+            ended = {s for s in self._session_pinned if not self._is_active_session(s)}
+            for entry_key in [k for k in self._pinned if k[0] in ended]:
+                self._remove(entry_key)
+                self._released += 1
+        self._evictions += evicted
+        return evicted
+
+    def metrics(self):
+        """Current memory usage and counters, for logging and admin views"""
+        with self._lock:
+            sessions = {session_id for session_id, _ in self._entries} | set(self._session_pinned)
+            return {
+                "bytes": self._bytes,
+                "budget_bytes": self.budget_bytes,
+                "pinned_bytes": self._pinned_bytes,
+                "entries": len(self._entries) + len(self._pinned),
+                "pinned_entries": len(self._pinned),
+                "sessions": len(sessions),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "released": self._released,
+            }
+
+
+def _is_active_streamlit_session(session_id):
+    """True unless Streamlit reports the session as ended"""
+    try:
+        from streamlit.runtime import Runtime
+        return Runtime.instance().is_active_session(session_id)
+    except Exception:
+        return True
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_memory_store():
+    """Process-wide MemoryStore sized from $SESSION_MEMORY_BUDGET_MB and $SESSION_PINNED_LIMIT_MB"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            budget_mb = float(os.getenv(BUDGET_ENV) or DEFAULT_BUDGET_MB)
+            session_mb = float(os.getenv(SESSION_BUDGET_ENV) or DEFAULT_SESSION_BUDGET_MB)
+            _store = MemoryStore(
+                int(budget_mb * 1024 * 1024), int(session_mb * 1024 * 1024), _is_active_streamlit_session
+            )
+        return _store
+
+
+def get_session_value(key):
+    """Pinned value stored for the current session, or None"""
+    return get_memory_store().get(current_session_id(), key)
+
+
+def set_session_value(key, value):
+    """Pin a value for the current session; returns False if it did not fit"""
+    return get_memory_store().put(current_session_id(), key, value, pinned=True)
+
+
+def clear_session_value(key):
+    """Drop a value stored for the current session"""
+    get_memory_store().remove(current_session_id(), key)
+
+
+def current_session_id():
+    """Id of the Streamlit session running this script, or 'default' outside one"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else "default"
+    except Exception:
+        return "default"
@@ -2,24 +2,142 @@
 Core name generation logic for YouTube channel names.
 """
 
-def generate_youtube_names(description, language, tone, variants, api_key=None):
-    """Generate YouTube channel names using improved prompts"""
+# How many fallback candidates to generate per requested name before ranking
+FALLBACK_OVERGENERATE = 3
+
+
+def generate_ranked_fallback_names(description, variants, used_names=None, near_duplicates=None):
+    """Over-generate fallback names and keep the best ``variants`` by score"""
+    from core.fallback_generator import generate_fallback_names
+    from core.name_parser import parse_names, names_to_response
+    from core.name_scorer import rank_names
+    
+    candidates = parse_names(generate_fallback_names(
+        description, variants * FALLBACK_OVERGENERATE, used_names, near_duplicates
+    ))
+    return names_to_response(rank_names(candidates, description, variants))
+
+
+def filter_ai_names(response, near_duplicates):
+    """Split a Gemini response into (kept, rejected) names by near-duplicate checks
+
+    Returns None when the response cannot be parsed into names.
+    """
+    from core.name_parser import parse_names
+    
+    try:
+        names = parse_names(response)
+    except Exception:
+        return None
+    if not names:
+        return None
+    kept, rejected = [], []
+    for name in names:
+        (kept if near_duplicates.add_if_new(name) else rejected).append(name)
+    return kept, rejected
+
+
+def record_history(description, language, tone, variants, response, source, latency_ms):
+    """Save a generation to the local history store without failing the request
+
+    ``source`` labels every name in ``response``; AI results are never mixed
+    with fallback names, so one label per generation is accurate.
+    """
+    from core.history_store import get_history_store
+    from core.name_parser import parse_names
+    
+    try:
+        names = parse_names(response)
+        if names:
+            get_history_store().record_generation(description, language, tone, variants, names, source, latency_ms)
+    except Exception:
+        pass
+
+
+def generate_youtube_names(description, language, tone, variants, api_key=None, exclude_names=None, near_duplicates=None):
+    """Generate YouTube channel names using improved prompts
+
+    ``near_duplicates`` is an optional shared NearDuplicateIndex; when omitted,
+    one is seeded from ``exclude_names``. Every generation is recorded in the
+    local history store along with its source ('ai' or 'fallback') and latency.
+    """
+    from core.near_duplicates import NearDuplicateIndex
+    from core.name_parser import names_to_response
+    from core.name_scorer import rank_names
     from services.gemini_api import gemini_text_response
     from core.prompt_builder import build_youtube_prompt
-    from core.fallback_generator import generate_fallback_names
     import streamlit as st
+    import time
     
-    prompt = build_youtube_prompt(description, language, tone, variants)
+    started = time.perf_counter()
+    prompt = build_youtube_prompt(description, language, tone, variants, exclude_names)
+    if near_duplicates is None:
+        near_duplicates = NearDuplicateIndex(exclude_names)
     
+    source = 'fallback'
     try:
         response = gemini_text_response(prompt, api_key)
         if response == 'RATE_LIMIT':
             st.info('ℹ️ Using our smart fallback name generator for better results.')
-            return generate_fallback_names(description, variants)
-        if response is None:
+            result = generate_ranked_fallback_names(description, variants, exclude_names, near_duplicates)
+        elif response is None:
             st.info('ℹ️ Using our smart fallback name generator for better results.')
-            return generate_fallback_names(description, variants)
-        return response
+            result = generate_ranked_fallback_names(description, variants, exclude_names, near_duplicates)
+        else:
+            source = 'ai'
+            filtered = filter_ai_names(response, near_duplicates)
+            if filtered is None:
+                result = response
+            else:
+                kept, rejected = filtered
+                shortfall = variants - len(kept)
+                if shortfall > 0 and rejected:
+                    # Ask Gemini once more for the names lost to near-duplicate filtering
+                    retry_prompt = build_youtube_prompt(
+                        description, language, tone, shortfall, list(exclude_names or []) + kept + rejected
+                    )
+                    retry = gemini_text_response(retry_prompt, api_key)
+                    if retry and retry != 'RATE_LIMIT':
+                        more = filter_ai_names(retry, near_duplicates)
+                        if more:
+                            kept += more[0][:shortfall]
+                if len(kept) < variants:
+                    st.info(f'ℹ️ {len(kept)} new names left after removing repeats of names you have already seen.')
+                result = names_to_response(rank_names(kept, description))
     except Exception as e:
+        source = 'fallback'
         st.info('ℹ️ Using our smart fallback name generator for better results.')
-        return generate_fallback_names(description, variants)
+        result = generate_ranked_fallback_names(description, variants, exclude_names, near_duplicates)
+    
+    latency_ms = (time.perf_counter() - started) * 1000
+    record_history(description, language, tone, variants, result, source, latency_ms)
+    return result
+
+
+def generate_more_names(description, language, tone, variants, names_text, api_key=None):
+    """Generate another page of names and append it to the existing results
+
+    Names already in ``names_text`` are sent as an exclusion list and any repeats
+    are dropped, so the returned response only grows with new names.
+    """
+    from core.name_parser import parse_names, name_key, names_to_response
+    
+    try:
+        names = parse_names(names_text)
+    except Exception:
+        names = []
+    seen = {name_key(n) for n in names}
+    
+    more_text = generate_youtube_names(description, language, tone, variants, api_key, names)
+    try:
+        more_names = parse_names(more_text) if more_text else []
+    except Exception:
+        more_names = []
+    
+    for name in more_names:
+        key = name_key(name)
+        if key not in seen:
+            names.append(name)
+            seen.add(key)
+    
+    return names_to_response(names)
@@ -0,0 +1,150 @@
+"""
+Memory-mapped index of existing channel names for collision checks.
+
+The index file holds a Bloom filter followed by a sorted table of normalized
+names (UTF-8 blob plus an offsets array). Lookups hit the Bloom filter first
+and only binary search the memory-mapped table on a possible match, so no
+names are loaded into Python objects.
+
+Build one from a text file with one channel name per line:
+
+    python -m core.name_index known_channels.txt channel_names.idx
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+from core.name_parser import name_key
+
+# Environment variable pointing at a built index file
+INDEX_PATH_ENV = "CHANNEL_NAME_INDEX"
+
+MAGIC = b"YTNI"
+VERSION = 1
+# magic, version, count, bloom bits, bloom hashes
+_HEADER = struct.Struct("<4sIQQI")
+
+# Target Bloom filter false positive rate
+BLOOM_FP_RATE = 0.01
+
+
+def _bloom_positions(key, num_bits, num_hashes):
+    """Bit positions for a key using double hashing"""
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1, h2 = struct.unpack("<QQ", digest)
+    return [(h1 + i * h2) % num_bits for i in range(num_hashes)]
+
+
+def build_name_index(source_path, index_path, fp_rate=BLOOM_FP_RATE):
+    """Build an index file from a text file of channel names; returns the count"""
+    with open(source_path, encoding="utf-8", errors="ignore") as f:
+        keys = sorted({name_key(line).encode("utf-8") for line in f if line.strip()})
+
+    count = len(keys)
+    num_bits = max(64, int(-count * math.log(fp_rate) / math.log(2) ** 2))
+    num_bits += -num_bits % 8
+    num_hashes = max(1, round(num_bits / max(count, 1) * math.log(2)))
+
+    bloom = np.zeros(num_bits // 8, dtype=np.uint8)
+    offsets = np.zeros(count + 1, dtype=np.uint64)
+    position = 0
+    for i, key in enumerate(keys):
+        for bit in _bloom_positions(key, num_bits, num_hashes):
+            bloom[bit >> 3] |= 1 << (bit & 7)
+        position += len(key)
+        offsets[i + 1] = position
+
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, count, num_bits, num_hashes))
+        f.write(bloom.tobytes())
+        f.write(offsets.tobytes())
+        for key in keys:
+            f.write(key)
+    os.replace(tmp_path, index_path)
+    return count
+
+
+class ChannelNameIndex:
+    """Read-only, memory-mapped lookup table of known channel names"""
+
+    def __init__(self, index_path):
+        self._file = open(index_path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, num_bits, num_hashes = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a channel name index: {index_path}")
+        self.count = count
+        self._num_bits = num_bits
+        self._num_hashes = num_hashes
+
+        bloom_start = _HEADER.size
+        offsets_start = bloom_start + num_bits // 8
+        self._strings_start = offsets_start + (count + 1) * 8
+        self._bloom = np.frombuffer(self._mm, dtype=np.uint8, count=num_bits // 8, offset=bloom_start)
+        self._offsets = np.frombuffer(self._mm, dtype=np.uint64, count=count + 1, offset=offsets_start)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, name):
+        return self.contains(name)
+
+    def _key_at(self, i):
+        start = self._strings_start + int(self._offsets[i])
+        end = self._strings_start + int(self._offsets[i + 1])
+        return self._mm[start:end]
+
+    def _maybe_contains(self, key):
+        bloom = self._bloom
+        return all(bloom[bit >> 3] & (1 << (bit & 7)) for bit in _bloom_positions(key, self._num_bits, self._num_hashes))
+
+    def contains(self, name):
+        """True if the normalized name is in the index"""
+        key = name_key(name).encode("utf-8")
+        if not self._maybe_contains(key):
+            return False
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < self.count and self._key_at(lo) == key
+
+    def taken_flags(self, names):
+        """List of booleans marking which names are already taken"""
+        return [self.contains(name) for name in names]
+
+    def filter_available(self, names):
+        """Names that are not in the index"""
+        return [name for name in names if not self.contains(name)]
+
+    def close(self):
+        # Drop the numpy views before closing the map they point into
+        self._bloom = self._offsets = None
+        self._mm.close()
+        self._file.close()
+
+
+def open_name_index(index_path=None):
+    """Open the index at ``index_path`` or $CHANNEL_NAME_INDEX; None if unavailable"""
+    index_path = index_path or os.getenv(INDEX_PATH_ENV)
+    if not index_path or not os.path.exists(index_path):
+        return None
+    return ChannelNameIndex(index_path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m core.name_index <names.txt> <index file>")
+    total = build_name_index(sys.argv[1], sys.argv[2])
+    print(f"Indexed {total} channel names into {sys.argv[2]}")
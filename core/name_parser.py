@@ -0,0 +1,47 @@
+"""
+Parsing of raw name generation responses into name lists.
+"""
+
+import orjson
+
+
+def parse_names(names_text):
+    """Extract the list of names from a Gemini or fallback response"""
+    # Try to extract JSON from response
+    start = names_text.find('{')
+    end = names_text.rfind('}')
+    if start != -1 and end != -1:
+        json_str = names_text[start:end+1]
+        data = orjson.loads(json_str)
+        return data.get('names', [])
+
+    # Fallback: split by lines and clean up
+    names = []
+    for line in names_text.split('\n'):
+        line = line.strip('- •\n "')
+        # Remove numbering (1., 2., etc.)
+        if line and not line.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')):
+            # Clean up common prefixes
+            line = line.replace('Name:', '').replace('Channel:', '').strip()
+            if line and len(line) > 2 and len(line) < 50:
+                names.append(line)
+    return names
+
+
+def name_key(name):
+    """Normalized key used to compare names for duplicates"""
+    return " ".join(name.split()).casefold()
+
+
+def names_to_response(names):
+    """Serialize a name list into the same JSON shape Gemini returns"""
+    return f'{{"names": {orjson.dumps(names).decode()}}}'
+
+
+def compact_response(names_text):
+    """Re-serialize a raw response as just its names, dropping any extra LLM text"""
+    try:
+        names = parse_names(names_text)
+    except Exception:
+        return names_text
+    return names_to_response(names) if names else names_text
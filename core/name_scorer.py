@@ -0,0 +1,163 @@
+"""
+Vectorized quality scoring and top-k ranking of candidate names.
+
+Names are packed into a fixed-width code point matrix so every feature is
+computed with array operations over the whole batch instead of per name.
+"""
+
+from functools import lru_cache
+import re
+
+import numpy as np
+
+from core.fallback_generator import STOP_WORDS
+
+# Names are truncated to this many characters for the character features
+MAX_NAME_LEN = 32
+
+# Ideal total length (characters) and words per name
+IDEAL_LENGTH = (10, 18)
+IDEAL_WORDS = (2, 3)
+
+# Generic fillers the prompt asks Gemini to avoid
+FILLER_WORDS = ("channel", "tube", "tv", "official", "media", "studio", "hub")
+
+# Feature weights; the final score is the weighted sum of the features
+WEIGHTS = {
+    "length": 1.0,
+    "words": 0.5,
+    "syllables": 0.75,
+    "pronounceable": 1.0,
+    "alliteration": 0.5,
+    "keywords": 1.5,
+    "fillers": -1.0,
+    "invalid_chars": -2.0,
+}
+
+# Words split on spaces, punctuation and camel case boundaries ("RecipeTV" -> "Recipe", "TV")
+_WORD_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[^\W_A-Z]+")
+
+_VOWELS = np.array([ord(c) for c in "aeiouy"], dtype=np.uint32)
+_SPACE = ord(" ")
+
+
+def _to_matrix(names):
+    """Pack names into an (n, MAX_NAME_LEN) matrix of lowercase code points"""
+    packed = np.char.lower(np.array(names, dtype=f"U{MAX_NAME_LEN}"))
+    return packed.view(np.uint32).reshape(len(names), MAX_NAME_LEN)
+
+
+def _normalize_word(word):
+    """Lowercase a word and strip a plural ending ("recipes" -> "recipe")"""
+    word = word.lower()
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith(("sses", "shes", "ches", "xes")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+@lru_cache(maxsize=256)
+def description_keywords(description):
+    """Normalized content words of a channel description"""
+    words = (_normalize_word(w) for w in _WORD_RE.findall(description))
+    return frozenset(w for w in words if len(w) > 2 and w not in STOP_WORDS)
+
+
+def _tokenize(names):
+    """Flat array of normalized words plus the index of the name each came from"""
+    tokens = [_WORD_RE.findall(name) for name in names]
+    owners = np.repeat(np.arange(len(names)), [len(t) for t in tokens])
+    words = np.array([_normalize_word(w) for t in tokens for w in t], dtype=object)
+    return words, owners
+
+
+def _word_hits(words, owners, n, vocabulary):
+    """Per-name count of whole words found in the vocabulary"""
+    if not vocabulary or not len(words):
+        return np.zeros(n)
+    hits = np.isin(words, list(vocabulary))
+    return np.bincount(owners[hits], minlength=n).astype(np.float64)
+
+
+def _range_fit(values, low, high):
+    """1.0 inside [low, high], decaying linearly with distance outside it"""
+    distance = np.maximum(low - values, 0) + np.maximum(values - high, 0)
+    return np.clip(1.0 - distance / max(high, 1), 0.0, 1.0)
+
+
+def score_features(names, description=""):
+    """Compute the per-name feature matrix as a dict of float arrays"""
+    n = len(names)
+    codes = _to_matrix(names)
+
+    present = codes != 0
+    space = codes == _SPACE
+    ascii_letter = (codes >= ord("a")) & (codes <= ord("z"))
+    # Treat non-ASCII code points as letters so other scripts are not penalised
+    letter = ascii_letter | (codes > 127)
+    vowel = np.isin(codes, _VOWELS)
+    consonant = ascii_letter & ~vowel
+
+    lengths = np.fromiter((len(name) for name in names), dtype=np.int32, count=n)
+
+    # Word starts: a letter at position 0 or right after a space
+    prev_space = np.ones_like(space)
+    prev_space[:, 1:] = space[:, :-1]
+    word_start = letter & prev_space
+    words = word_start.sum(axis=1)
+
+    # Syllables: runs of vowels
+    prev_vowel = np.zeros_like(vowel)
+    prev_vowel[:, 1:] = vowel[:, :-1]
+    syllables = (vowel & ~prev_vowel).sum(axis=1)
+    syllables_per_word = syllables / np.maximum(words, 1)
+
+    # Pronounceability: penalise clusters of three or more consonants
+    clusters = (consonant[:, :-2] & consonant[:, 1:-1] & consonant[:, 2:]).sum(axis=1)
+    pronounceable = 1.0 / (1.0 + clusters)
+
+    # Alliteration: another word starts with the same letter as the first word
+    first = codes[:, :1]
+    alliteration = ((word_start & (codes == first)).sum(axis=1) >= 2).astype(np.float64)
+
+    # Keyword overlap and filler penalties compare whole words, not substrings
+    tokens, owners = _tokenize(names)
+    keyword_hits = _word_hits(tokens, owners, n, description_keywords(description) if description else ())
+    filler_hits = _word_hits(tokens, owners, n, FILLER_WORDS)
+
+    invalid = (present & ~letter & ~space).sum(axis=1)
+
+    return {
+        "length": _range_fit(lengths, *IDEAL_LENGTH),
+        "words": _range_fit(words, *IDEAL_WORDS),
+        "syllables": _range_fit(syllables_per_word, 1, 3),
+        "pronounceable": pronounceable,
+        "alliteration": alliteration,
+        "keywords": np.minimum(keyword_hits, 2) / 2,
+        "fillers": np.minimum(filler_hits, 2),
+        "invalid_chars": np.minimum(invalid, 3) / 3,
+    }
+
+
+def score_names(names, description=""):
+    """Score names in bulk; higher is better"""
+    if not names:
+        return np.zeros(0)
+    features = score_features(names, description)
+    return sum(WEIGHTS[name] * values for name, values in features.items())
+
+
+def rank_names(names, description="", top_k=None):
+    """Return the top_k names ordered by score, best first"""
+    if not names or (top_k is not None and top_k <= 0):
+        return []
+    scores = score_names(names, description)
+    if top_k is None or top_k >= len(names):
+        order = np.argsort(-scores, kind="stable")
+    else:
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        order = top[np.argsort(-scores[top], kind="stable")]
+    return [names[i] for i in order]
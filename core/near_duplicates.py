@@ -0,0 +1,134 @@
+"""
+Near-duplicate detection for names using MinHash signatures and LSH.
+
+Each name is reduced to character n-gram shingles, summarised by a MinHash
+signature and bucketed by bands of that signature, so a new candidate is only
+compared against names that share at least one band instead of the whole corpus.
+"""
+
+import zlib
+
+import numpy as np
+
+from core.name_parser import name_key
+
+# Character n-gram size used for shingles; bigrams keep one-letter edits of short
+# names ("RecipeTV" / "RecipesTV") above the threshold
+SHINGLE_SIZE = 2
+
+# 20 bands x 3 rows puts the LSH threshold at roughly (1/20) ** (1/3) = 0.37, so
+# pairs at the 0.5 threshold become candidates ~93% of the time; candidates are
+# then confirmed with the exact Jaccard similarity of their shingle sets
+NUM_PERM = 60
+NUM_BANDS = 20
+
+# Jaccard similarity of shingle sets at or above which two names are near-duplicates
+DEFAULT_THRESHOLD = 0.5
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+def shingles(name, size=SHINGLE_SIZE):
+    """Character n-grams of the normalized name with separators removed
+
+    >>> shingles("Code Hub") == shingles("CodeHub")
+    True
+    """
+    text = "".join(name_key(name).split())
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class NearDuplicateIndex:
+    """Running corpus of names with sublinear near-duplicate lookups"""
+
+    def __init__(self, names=None, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, num_bands=NUM_BANDS, seed=1):
+        if num_perm % num_bands:
+            raise ValueError("num_perm must be divisible by num_bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.rows = num_perm // num_bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._buckets = [{} for _ in range(num_bands)]
+        self._shingles = []
+        self._keys = set()
+        for name in names or ():
+            self.add(name)
+
+    def __len__(self):
+        return len(self._shingles)
+
+    def signature(self, name):
+        """MinHash signature of a name as a uint64 array of length num_perm"""
+        return self._signature(shingles(name))
+
+    def _signature(self, name_shingles):
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in name_shingles), dtype=np.uint64
+        )
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _bands(self, signature):
+        for band in range(self.num_bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def _find(self, name, name_shingles, signature):
+        if name_key(name) in self._keys:
+            return True
+        checked = set()
+        for band, key in self._bands(signature):
+            for idx in self._buckets[band].get(key, ()):
+                if idx in checked:
+                    continue
+                checked.add(idx)
+                # Confirm LSH candidates exactly; the MinHash estimate is too noisy near the threshold
+                other = self._shingles[idx]
+                if len(name_shingles & other) >= self.threshold * len(name_shingles | other):
+                    return True
+        return False
+
+    def _insert(self, name, name_shingles, signature):
+        idx = len(self._shingles)
+        self._shingles.append(name_shingles)
+        self._keys.add(name_key(name))
+        for band, key in self._bands(signature):
+            self._buckets[band].setdefault(key, []).append(idx)
+
+    def is_near_duplicate(self, name):
+        """True if the name is an exact or near duplicate of an indexed name
+
+        >>> index = NearDuplicateIndex(["Code Hub", "RecipeTV", "TasteTube", "Kitchen Pro"])
+        >>> [index.is_near_duplicate(n) for n in ("CodeHub", "RecipesTV", "Taste Tube", "Chef Zone", "Kitchen Elite")]
+        [True, True, True, False, False]
+        """
+        name_shingles = frozenset(shingles(name))
+        return self._find(name, name_shingles, self._signature(name_shingles))
+
+    def add(self, name):
+        """Add a name to the corpus unconditionally"""
+        name_shingles = frozenset(shingles(name))
+        self._insert(name, name_shingles, self._signature(name_shingles))
+
+    def add_if_new(self, name):
+        """Add the name unless it is a near duplicate; returns True if added"""
+        name_shingles = frozenset(shingles(name))
+        signature = self._signature(name_shingles)
+        if self._find(name, name_shingles, signature):
+            return False
+        self._insert(name, name_shingles, signature)
+        return True
+
+
+def filter_near_duplicates(names, index=None):
+    """Keep only names that are not near duplicates of earlier ones
+
+    Pass a shared ``index`` to check against (and grow) a running corpus.
+    """
+    if index is None:
+        index = NearDuplicateIndex()
+    return [name for name in names if index.add_if_new(name)]
@@ -2,11 +2,28 @@
 Prompt building logic for AI name generation.
 """
 
-def build_youtube_prompt(description, language, tone, variants):
+# Cap on how many already-shown names are sent back to Gemini per page
+MAX_EXCLUDED_NAMES = 60
+
+
+def build_exclusion_block(exclude_names):
+    """Builds the compact "already suggested" section for follow-up pages."""
+    if not exclude_names:
+        return ""
+    recent = list(exclude_names)[-MAX_EXCLUDED_NAMES:]
+    return f"""
+Already suggested (do NOT repeat or closely echo any of these):
+{"; ".join(recent)}
+"""
+
+
+def build_youtube_prompt(description, language, tone, variants, exclude_names=None):
     """Builds a stricter, higher-quality prompt for brandable YouTube names.
 
     The prompt enforces: exact count, strict JSON output, language/script control,
-    anti-generic constraints, and brandability/variety guidance.
+    anti-generic constraints, and brandability/variety guidance. When
+    ``exclude_names`` is given, the already-shown names are listed after the
+    constraints, so everything before them stays identical across pages.
     """
 
     return f"""
@@ -27,7 +44,7 @@ Hard constraints (must all be satisfied):
 - Avoid generic fillers: do not overuse or rely on words like "Channel", "Tube", "TV", "Official", "Media", "Studio", "Hub". Permit at most one name that uses one of those as a tasteful suffix.
 - Uniqueness: no duplicates or near-duplicates; vary structure (e.g., compound, metaphor, subtle alliteration, contrast pairs) without clichés.
 - Safety: avoid trademarks/brand names, personal names, or sensitive content.
-
+{build_exclusion_block(exclude_names)}
 Validation you must perform BEFORE responding:
 - The JSON array length is {variants}.
 - Every item satisfies ALL constraints.
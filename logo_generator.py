@@ -1,28 +1,26 @@
 import streamlit as st
 import orjson
 from typing import List, Dict, Optional
+from core.memory_store import get_session_value, set_session_value, clear_session_value
 
 
 def generate_logos(names, style, font, colors, size, use_ai, api_key):
     """Generate logos for selected names"""
-    logos = {}
-    
     # Get color palette
     color_palette = get_color_palette(colors)
+    return {name: generate_logo(name, style, font, color_palette, size, use_ai, api_key)[0] for name in names}
+
+
+def generate_logo(name, style, font, color_palette, size, use_ai, api_key):
+    """Generate one logo; returns (svg, True if it came from the AI)"""
+    if use_ai and api_key:
+        # Try AI generation first
+        ai_logo = generate_ai_logo(name, style, api_key, size)
+        if ai_logo:
+            return ai_logo, True
     
-    for name in names:
-        if use_ai and api_key:
-            # Try AI generation first
-            ai_logo = generate_ai_logo(name, style, api_key, size)
-            if ai_logo:
-                logos[name] = ai_logo
-                continue
-        
-        # Fallback to template
-        template_logo = create_template_logo(name, style, font, color_palette, size)
-        logos[name] = template_logo
-    
-    return logos
+    # Fallback to template
+    return create_template_logo(name, style, font, color_palette, size), False
 
 
 def get_color_palette(palette_name):
@@ -228,19 +226,56 @@ def render_logo_section(names):
             
             if st.button("Generate Logos"):
                 with st.spinner("Generating logos..."):
-                    logos = generate_logos(selected_names, logo_style, logo_font, logo_colors, logo_size, use_ai, ai_api_key)
-                    
-                    if logos:
-                        st.markdown('<h4 style="margin-top:1rem;">🎨 Generated Logos</h4>', unsafe_allow_html=True)
-                        for name, logo_svg in logos.items():
-                            with st.container(border=True):
-                                st.markdown(f"**{name}**")
-                                st.markdown(logo_svg, unsafe_allow_html=True)
-                                
-                                st.download_button(
-                                    label="Download SVG",
-                                    data=logo_svg.encode("utf-8"),
-                                    file_name=f"{name.replace(' ', '_')}_{logo_style.lower()}_{logo_size}.svg",
-                                    mime="image/svg+xml",
-                                    key=f"dl_svg_{name}"
-                                )
+                    # Template logos are cheap to rebuild from their spec on each render;
+                    # AI logos cannot be rebuilt, so they are pinned in the session's memory budget
+                    clear_logos()
+                    color_palette = get_color_palette(logo_colors)
+                    specs = []
+                    unsaved = {}
+                    for name in selected_names:
+                        logo_svg, is_ai = generate_logo(name, logo_style, logo_font, color_palette, logo_size, use_ai, ai_api_key)
+                        spec = (name, logo_style, logo_font, logo_colors, logo_size)
+                        if is_ai and not set_session_value(("ai_logo",) + spec, logo_svg):
+                            unsaved[spec] = logo_svg
+                        specs.append((spec, is_ai))
+                    st.session_state['logo_specs'] = specs
+                if unsaved:
+                    st.warning("⚠️ Not enough memory to keep every AI logo; some are shown only until the page updates.")
+                render_logos(specs, unsaved)
+            else:
+                render_logos(st.session_state.get('logo_specs', []))
+
+
+def clear_logos():
+    """Drop the current session's logos and their pinned AI logo memory"""
+    for spec, is_ai in st.session_state.pop('logo_specs', []):
+        if is_ai:
+            clear_session_value(("ai_logo",) + spec)
+
+
+def render_logos(specs, unsaved=None):
+    """Show generated logos, rebuilding template logos from their spec"""
+    if not specs:
+        return
+    
+    st.markdown('<h4 style="margin-top:1rem;">🎨 Generated Logos</h4>', unsafe_allow_html=True)
+    for spec, is_ai in specs:
+        name, logo_style, logo_font, logo_colors, logo_size = spec
+        if is_ai:
+            logo_svg = (unsaved or {}).get(spec) or get_session_value(("ai_logo",) + spec)
+            if logo_svg is None:
+                st.caption(f"AI logo for {name} is no longer available; generate it again.")
+                continue
+        else:
+            logo_svg = create_template_logo(name, logo_style, logo_font, get_color_palette(logo_colors), logo_size)
+        with st.container(border=True):
+            st.markdown(f"**{name}**")
+            st.markdown(logo_svg, unsafe_allow_html=True)
+            
+            st.download_button(
+                label="Download SVG",
+                data=logo_svg.encode("utf-8"),
+                file_name=f"{name.replace(' ', '_')}_{logo_style.lower()}_{logo_size}.svg",
+                mime="image/svg+xml",
+                key=f"dl_svg_{name}"
+            )
@@ -4,8 +4,12 @@ Clean modular architecture following best programming practices.
 """
 
 import streamlit as st
-from core.name_generator import generate_youtube_names
+from core.name_generator import generate_youtube_names, generate_more_names
 from ui.results_display import display_results
+from ui.history_display import render_history_section
+from core.name_parser import compact_response
+from core.memory_store import get_session_value, set_session_value, clear_session_value
+from logo_generator import clear_logos
 
 def main():
     # Set page configuration
@@ -111,6 +115,9 @@ def main():
             )
             
 
+    # Names that did not fit the memory budget are shown for this run only
+    unsaved_names = None
+
     # Generate Names Button
     if st.button('**Generate YouTube Channel Names**'):
         with st.spinner("Generating channel names..."):
@@ -124,7 +131,17 @@ def main():
                 )
                 
                 if channel_names:
-                    st.session_state['generated_names'] = channel_names
+                    # Keep only the parsed names, not the raw model output, pinned in the
+                    # session's share of the memory budget
+                    clear_logos()
+                    channel_names = compact_response(channel_names)
+                    if not set_session_value('generated_names', channel_names):
+                        st.warning("⚠️ Not enough memory to keep these names; they are shown only until the page updates.")
+                        clear_session_value('generated_names')
+                        unsaved_names = channel_names
+                    st.session_state['generation_inputs'] = (
+                        input_description, input_language, input_tone, input_variants
+                    )
                 else:
                     st.error("💥 **Failed to generate channel names. Please try again!**")
                     st.info("💡 **Tips to fix this:**")
@@ -136,8 +153,23 @@ def main():
                     """)
 
     # Display Results
-    if 'generated_names' in st.session_state and st.session_state['generated_names']:
-        display_results(st.session_state['generated_names'])
+    generated_names = unsaved_names or get_session_value('generated_names')
+    if generated_names:
+        display_results(generated_names)
+
+        # Load More Names Button (appends a new page, excluding names already shown)
+        if 'generation_inputs' in st.session_state and st.button('**Load More Names**'):
+            with st.spinner("Generating more channel names..."):
+                description, language, tone, variants = st.session_state['generation_inputs']
+                more_names = generate_more_names(
+                    description, language, tone, variants, generated_names, None
+                )
+            if set_session_value('generated_names', more_names):
+                st.rerun()
+            st.warning("⚠️ Not enough memory to keep more names for this session.")
+
+    # Generation History
+    render_history_section()
 
 
 if __name__ == "__main__":
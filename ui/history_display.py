@@ -0,0 +1,72 @@
+"""
+Generation history search and browsing.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from core.history_store import get_history_store
+
+PAGE_SIZE = 20
+
+
+def render_history_section():
+    """Render searchable, paginated history of past generations"""
+    with st.expander("🕘 Generation History", expanded=False):
+        try:
+            store = get_history_store()
+        except Exception as e:
+            st.warning(f"History is unavailable: {e}")
+            return
+
+        st.caption(f"Search {store.count_names():,} previously generated names without calling the API again.")
+
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            query = st.text_input("Search names or descriptions", placeholder="e.g., cooking, Byte", key="history_query")
+        with col2:
+            prefix = st.checkbox("Starts with", value=False, key="history_prefix",
+                                 help="Match the beginning of the name instead of keywords.")
+
+        # Keyset pagination: a stack of page cursors, reset when the search changes
+        search = (query.strip(), prefix)
+        if st.session_state.get('history_search') != search:
+            st.session_state['history_search'] = search
+            st.session_state['history_cursors'] = [None]
+        cursors = st.session_state['history_cursors']
+
+        try:
+            rows = store.search_names(query, prefix, PAGE_SIZE + 1, cursors[-1])
+        except Exception as e:
+            st.warning(f"Search failed: {e}")
+            return
+        has_next = len(rows) > PAGE_SIZE
+        rows = rows[:PAGE_SIZE]
+
+        if not rows:
+            st.info("No matching names in history yet.")
+            return
+
+        table = pd.DataFrame([{
+            "Name": row['name'],
+            "Source": "AI" if row['source'] == 'ai' else "Fallback",
+            "Description": row['description'],
+            "Language": row['language'],
+            "Tone": row['tone'],
+            "Generated": datetime.fromtimestamp(row['created_at']).strftime("%Y-%m-%d %H:%M"),
+            "Latency (ms)": round(row['latency_ms'] or 0),
+        } for row in rows])
+        st.dataframe(table, hide_index=True, use_container_width=True)
+
+        nav_cols = st.columns([1, 1, 4])
+        with nav_cols[0]:
+            if st.button("← Previous", disabled=len(cursors) == 1, key="history_newer"):
+                cursors.pop()
+                st.rerun()
+        with nav_cols[1]:
+            if st.button("Next →", disabled=not has_next, key="history_older"):
+                cursors.append(rows[-1]['cursor'])
+                st.rerun()
+        with nav_cols[2]:
+            st.caption(f"Page {len(cursors)}")
@@ -7,9 +7,21 @@ import streamlit.components.v1 as components
 import orjson
 import html as html_lib
 from core.fallback_generator import generate_fallback_names
+from core.name_parser import parse_names
+from core.name_index import open_name_index
 from logo_generator import render_logo_section
 
 
+@st.cache_resource
+def load_name_index():
+    """Open the known channel name index once per server process"""
+    try:
+        return open_name_index()
+    except Exception as e:
+        st.warning(f"Failed to open channel name index: {e}")
+        return None
+
+
 def display_results(names_text):
     """Display generated names with actions"""
     st.markdown('<h3 style="margin-top:2rem; color:#1976D2;">🎬 Generated YouTube Channel Names</h3>', unsafe_allow_html=True)
@@ -29,6 +41,13 @@ def display_results(names_text):
         transform: translateY(-2px);
         box-shadow: 0 4px 12px rgba(0,0,0,0.15);
     }
+    .name-taken {
+        font-size: 0.85em;
+        color: #C62828;
+        text-align: center;
+        margin-top: -0.5rem;
+        margin-bottom: 0.5rem;
+    }
     .name-title {
         font-size: 1.2em;
         font-weight: 600;
@@ -42,25 +61,7 @@ def display_results(names_text):
     
     # Parse the response
     try:
-        # Try to extract JSON from response
-        start = names_text.find('{')
-        end = names_text.rfind('}')
-        if start != -1 and end != -1:
-            json_str = names_text[start:end+1]
-            data = orjson.loads(json_str)
-            names = data.get('names', [])
-        else:
-            # Fallback: split by lines and clean up
-            lines = names_text.split('\n')
-            names = []
-            for line in lines:
-                line = line.strip('- •\n "')
-                # Remove numbering (1., 2., etc.)
-                if line and not line.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')):
-                    # Clean up common prefixes
-                    line = line.replace('Name:', '').replace('Channel:', '').strip()
-                    if line and len(line) > 2 and len(line) < 50:
-                        names.append(line)
+        names = parse_names(names_text)
     except Exception as e:
         st.warning(f"Failed to parse response: {e}")
         # Final fallback - try to extract any text that looks like a name
@@ -75,18 +76,23 @@ def display_results(names_text):
     if not names:
         st.warning("No valid names found. Using fallback names.")
         fallback_response = generate_fallback_names("YouTube channel", 5)
-        # Parse fallback response
-        start = fallback_response.find('{')
-        end = fallback_response.rfind('}')
-        if start != -1 and end != -1:
-            json_str = fallback_response[start:end+1]
-            data = orjson.loads(json_str)
-            names = data.get('names', [])
+        names = parse_names(fallback_response)
     
     if not names:
         st.warning("No names were returned. Try adjusting your inputs and generate again.")
         return
     
+    # Flag (or hide) names that already exist as channels
+    name_index = load_name_index()
+    taken = set()
+    if name_index is not None:
+        taken = {name for name in names if name_index.contains(name)}
+        if taken and st.checkbox(f"Hide {len(taken)} names that are already taken", value=False, key="hide_taken_names"):
+            names = [name for name in names if name not in taken]
+            if not names:
+                st.warning("All generated names are already taken. Try generating more names.")
+                return
+    
     # Display names in optimized multi-column grid
     st.markdown(f'<div style="margin-bottom: 1rem; padding: 0.5rem; background: #e3f2fd; border-radius: 8px; text-align: center;"><strong>📊 Generated {len(names)} unique channel names</strong></div>', unsafe_allow_html=True)
     
@@ -105,9 +111,10 @@ def display_results(names_text):
                 with col:
                     # Enhanced card styling with hover effects (escape name for safety)
                     safe_name = html_lib.escape(name)
+                    taken_html = '<div class="name-taken">⚠️ Already taken</div>' if name in taken else ''
                     st.markdown(f'''
                     <div class="name-card">
-                        <div class="name-title">{safe_name}</div>
+                        <div class="name-title">{safe_name}</div>{taken_html}
                     </div>
                     ''', unsafe_allow_html=True)
                     